@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementations of the character-level scans in tex_word_counter.py.
+Build with `python setup.py build_ext --inplace` from the repository root.
+"""
+
+
+cdef inline bint is_line_break(Py_UCS4 c):
+    """Match the line boundaries recognised by str.splitlines."""
+    return c in "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+cpdef Py_ssize_t count_whitespace_separated_words(str content):
+    """Count whitespace-separated words, like len(content.split()) without the list."""
+    cdef Py_ssize_t words = 0
+    cdef bint in_word = False
+    cdef Py_UCS4 c
+
+    for c in content:
+        if c.isspace():
+            in_word = False
+        elif not in_word:
+            words += 1
+            in_word = True
+
+    return words
+
+
+cpdef str strip_tex_comments(str content):
+    """Remove % comments from TeX content, keeping escaped \\% signs."""
+    if "%" not in content:
+        return content
+
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(content)
+    cdef Py_ssize_t kept_start = 0
+    cdef Py_ssize_t backslashes = 0
+    cdef bint in_comment = False
+    cdef Py_UCS4 c
+    parts = []
+
+    for i in range(n):
+        c = content[i]
+        if in_comment:
+            # The comment ends at the line break, which is kept
+            if is_line_break(c):
+                in_comment = False
+                kept_start = i
+            continue
+
+        # The % starts a comment unless it is preceded by an odd number of backslashes
+        if c == "%" and backslashes % 2 == 0:
+            parts.append(content[kept_start:i])
+            in_comment = True
+        elif c == "\\":
+            backslashes += 1
+            continue
+        backslashes = 0
+
+    if not in_comment:
+        parts.append(content[kept_start:])
+    return "".join(parts)
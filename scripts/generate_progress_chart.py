@@ -3,10 +3,31 @@
 Script to generate an SVG progress bar/chart showing daily word count progress in .tex files.
 """
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+# orjson is optional, it parses JSON several times faster
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# A single bar of the chart, with a tooltip showing the day's change and total
+_BAR_TMPL = (
+    b'<rect x="%.1f" y="%.1f" width="%.1f" height="%.1f" fill="%s" rx="2">'
+    b'<title>%s: %+d words (total: %d)</title></rect>'
+)
+
+_EMPTY_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="400" height="120" viewBox="0 0 400 120">
+  <style>
+    .title { font: bold 14px sans-serif; fill: #24292f; }
+    .subtitle { font: 12px sans-serif; fill: #57606a; }
+  </style>
+  <rect width="400" height="120" fill="#f6f8fa" rx="6"/>
+  <text x="200" y="50" class="title" text-anchor="middle">📝 LaTeX Writing Progress</text>
+  <text x="200" y="75" class="subtitle" text-anchor="middle">No data yet. Start writing!</text>
+</svg>""".encode()
+
 
 def generate_progress_svg(history: dict, output_path: Path) -> None:
     """Generate an SVG showing daily word count progress."""
@@ -18,25 +39,17 @@ def generate_progress_svg(history: dict, output_path: Path) -> None:
     else:
         svg_content = generate_chart_svg(daily_counts)
 
-    output_path.write_text(svg_content)
+    output_path.write_bytes(svg_content)
     print(f"Generated SVG at {output_path}")
 
 
-def generate_empty_svg() -> str:
+def generate_empty_svg() -> bytes:
     """Generate an SVG for when there's no data."""
-    return """<svg xmlns="http://www.w3.org/2000/svg" width="400" height="120" viewBox="0 0 400 120">
-  <style>
-    .title { font: bold 14px sans-serif; fill: #24292f; }
-    .subtitle { font: 12px sans-serif; fill: #57606a; }
-  </style>
-  <rect width="400" height="120" fill="#f6f8fa" rx="6"/>
-  <text x="200" y="50" class="title" text-anchor="middle">📝 LaTeX Writing Progress</text>
-  <text x="200" y="75" class="subtitle" text-anchor="middle">No data yet. Start writing!</text>
-</svg>"""
+    return _EMPTY_SVG
 
 
-def generate_chart_svg(daily_counts: list) -> str:
-    """Generate an SVG bar chart showing daily word counts."""
+def generate_chart_svg(daily_counts: list) -> bytes:
+    """Generate an SVG bar chart showing daily word counts, encoded as UTF-8."""
     # Chart dimensions
     width = 500
     height = 200
@@ -45,49 +58,45 @@ def generate_chart_svg(daily_counts: list) -> str:
     chart_height = height - 2 * padding - 30  # Extra space for title
 
     # Calculate daily changes (words added compared to previous day)
-    changes = []
-    for i, entry in enumerate(daily_counts):
-        if i == 0:
-            changes.append({"date": entry["date"], "change": 0, "total": entry["words"]})
-        else:
-            prev_words = daily_counts[i - 1]["words"]
-            change = entry["words"] - prev_words
-            changes.append({"date": entry["date"], "change": change, "total": entry["words"]})
+    words = [entry["words"] for entry in daily_counts]
+    changes = [0] + [curr - prev for prev, curr in zip(words, words[1:])]
 
     # Get max values for scaling
-    max_change = max(abs(c["change"]) for c in changes) if changes else 1
-    if max_change == 0:
-        max_change = 1
+    max_change = max(max(map(abs, changes), default=0), 1)
+    bar_heights = [abs(change) / max_change * (chart_height / 2 - 10) for change in changes]
 
-    latest_total = daily_counts[-1]["words"] if daily_counts else 0
-    today_change = changes[-1]["change"] if changes else 0
+    latest_total = words[-1] if words else 0
+    today_change = changes[-1] if words else 0
 
     # Calculate bar width based on number of entries
-    num_bars = len(changes)
+    num_bars = len(daily_counts)
     bar_width = min(20, (chart_width - 10) / max(num_bars, 1))
     bar_gap = 2
 
     # Generate bars
     bars_svg = []
-    for i, entry in enumerate(changes):
+    for i, (entry, change, bar_height) in enumerate(zip(daily_counts, changes, bar_heights)):
         x = padding + i * (bar_width + bar_gap)
-        change = entry["change"]
 
         if change >= 0:
             # Positive change: bar goes up from middle
-            bar_height = (change / max_change) * (chart_height / 2 - 10) if max_change > 0 else 0
             y = padding + 30 + chart_height / 2 - bar_height
-            color = "#2ea44f"  # Green
+            color = b"#2ea44f"  # Green
         else:
             # Negative change: bar goes down from middle
-            bar_height = (abs(change) / max_change) * (chart_height / 2 - 10) if max_change > 0 else 0
             y = padding + 30 + chart_height / 2
-            color = "#cf222e"  # Red
-
-        bars_svg.append(
-            f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_width:.1f}" height="{max(bar_height, 1):.1f}" fill="{color}" rx="2">'
-            f'<title>{entry["date"]}: {change:+d} words (total: {entry["total"]})</title></rect>'
-        )
+            color = b"#cf222e"  # Red
+
+        bars_svg.append(_BAR_TMPL % (
+            x,
+            y,
+            bar_width,
+            max(bar_height, 1),
+            color,
+            entry["date"].encode(),
+            change,
+            entry["words"],
+        ))
 
     # Generate zero line
     zero_y = padding + 30 + chart_height / 2
@@ -105,7 +114,7 @@ def generate_chart_svg(daily_counts: list) -> str:
         change_text = "No change today"
         change_color = "#57606a"
 
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
+    header = f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
   <style>
     .title {{ font: bold 14px sans-serif; fill: #24292f; }}
     .subtitle {{ font: 12px sans-serif; fill: #57606a; }}
@@ -124,14 +133,16 @@ def generate_chart_svg(daily_counts: list) -> str:
 
   <!-- Chart area -->
   {zero_line}
-  {''.join(bars_svg)}
+  """
+    footer = f"""
 
   <!-- Labels -->
   <text x="{padding}" y="{height - 10}" class="label">Last {len(daily_counts)} days</text>
   <text x="{width - padding}" y="{height - 10}" class="label" text-anchor="end">Updated: {today_str}</text>
 </svg>"""
 
-    return svg
+    # Write the bars between the encoded header and footer without joining them as text
+    return b"".join([header.encode(), *bars_svg, footer.encode()])
 
 
 def main():
@@ -143,8 +154,7 @@ def main():
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     if history_file.exists():
-        with open(history_file, "r") as f:
-            history = json.load(f)
+        history = _loads(history_file.read_bytes())
     else:
         print(f"Warning: No history file found at {history_file}")
         history = {"daily_counts": []}
@@ -0,0 +1,17 @@
+"""
+Build the optional Cython extension used by scripts/tex_word_counter.py:
+
+    pip install cython setuptools
+    python setup.py build_ext --inplace
+
+The script falls back to its pure-Python implementation when the extension is not built.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="tex-word-counter",
+    package_dir={"": "scripts"},
+    ext_modules=cythonize([Extension("_tex_count", ["scripts/_tex_count.pyx"])]),
+)